@@ -1,10 +1,12 @@
 import sys
 import inspect
 import warnings
-from functools import wraps
+from functools import partial, wraps
 from pathlib import Path
+from typing import Callable
 from uuid import uuid4
 
+import panel as pn
 import param
 from loguru import logger
 
@@ -45,8 +47,26 @@ class Component(param.Parameterized):
             return NotImplemented
         return self.id == other.id
 
+    @staticmethod
+    def watch_for_view(
+        parameterized: param.Parameterized,
+        fn: Callable,
+        parameter_names: str | list[str],
+        **kwargs) -> param.parameterized.Watcher:
+        """
+        Watches parameters of a Parameterized to keep a view updated.
+        When the view is created within a Panel session, the watcher is removed
+        once the session is destroyed, so closed sessions don't keep their views
+        alive through the watched object.
+        """
+        watcher = parameterized.param.watch(fn, parameter_names, **kwargs)
+        if pn.state.curdoc is not None:
+            pn.state.on_session_destroyed(
+                lambda session_context: parameterized.param.unwatch(watcher))
+        return watcher
+
     @classmethod
-    def view(cls, func):
+    def view(cls, func=None, *, cache: bool = False):
         """Decorator for Component view methods that handles CSS loading, sizing, and Panel parameters.
 
         This decorator provides several key features for view methods:
@@ -60,6 +80,11 @@ class Component(param.Parameterized):
         ----------
         func : callable
             The view method to be decorated. Should return a Panel object.
+        cache : bool, default False
+            Whether to reuse the view for calls with the same arguments. Used
+            as @Component.view(cache=True) on Components with a view_cache
+            parameter, such as Payloads. A reused view is returned as is, so
+            calls with other arguments never change a view already on screen.
 
         Returns
         -------
@@ -94,6 +119,11 @@ class Component(param.Parameterized):
             ├── viewname_button.css    # CSS for button parts
             └── viewname_input.css     # CSS for input parts
 
+        View Caching:
+            - With cache=True, views are stored in view_cache, keyed by the view
+              name and the call arguments merged with the defaults
+            - A call with new arguments creates and caches a new view
+
         Examples
         --------
         >>> class MyComponent(Component):
@@ -120,6 +150,9 @@ class Component(param.Parameterized):
         param.Parameterized : Base class for parameterized objects
         panel.viewable.Viewable : Base class for Panel viewable objects
         """
+        if func is None:
+            return partial(cls.view, cache=cache)
+
         PANEL_PARAMS = {
             'width', 'height', 'min_width', 'max_width', 'min_height', 'max_height',
             'margin', 'sizing_mode', 'aspect_ratio', 'align',
@@ -153,6 +186,12 @@ class Component(param.Parameterized):
             # If the view doesn't exist, proceed with CSS loading and view creation
             view_name = func.__name__.replace('create_', '')
 
+            if cache:
+                # Keyed by repr as the CSS arguments are lists
+                view_key = (view_name, repr(args), repr(sorted(merged_kwargs.items())))
+                if view_key in self.view_cache:
+                    return self.view_cache[view_key]
+
             # Initialize cache for this view if needed
             if view_name not in self.css_cache:
                 self.css_cache[view_name] = {}
@@ -168,7 +207,7 @@ class Component(param.Parameterized):
             css_kwargs = [param for param in inspect.signature(func).parameters 
                          if param.endswith('_css')]
             
-            logger.debug(f"CSS kwargs found in {func.__name__}: {css_kwargs}")
+            logger.debug("CSS kwargs found in {}: {}", func.__name__, css_kwargs)
             
             # First load all potential CSS files for this view
             for key in css_kwargs:
@@ -177,13 +216,13 @@ class Component(param.Parameterized):
                     # Get the css folder path
                     css_folder = self._get_module_path() / 'css'
                     css_file_path = css_folder / f"{view_name}_{css_name}.css"
-                    logger.debug(f"Looking for component CSS file: {css_file_path}")
+                    logger.debug("Looking for component CSS file: {}", css_file_path)
                     try:
                         with open(css_file_path, 'r') as f:
                             self.css_cache[view_name][css_name] = f.read()
-                            logger.debug(f"Loaded component CSS from {css_file_path}")
+                            logger.debug("Loaded component CSS from {}", css_file_path)
                     except FileNotFoundError:
-                        logger.debug(f"Component CSS file not found: {css_file_path}")
+                        logger.debug("Component CSS file not found: {}", css_file_path)
                         self.css_cache[view_name][css_name] = ''
                     except Exception as e:
                         logger.warning(f"Error loading CSS: {str(e)}")
@@ -208,7 +247,10 @@ class Component(param.Parameterized):
                 # Update the custom_attrs with the combined CSS
                 custom_attrs[key] = css_list
 
-            logger.debug(f"Final CSS kwargs: {[(k,v) for k,v in custom_attrs.items() if k.endswith('_css')]}")
+            # Lazy so the CSS listing is only built when a sink accepts DEBUG
+            logger.opt(lazy=True).debug(
+                "Final CSS kwargs: {}",
+                lambda: [(k, v) for k, v in custom_attrs.items() if k.endswith('_css')])
 
             # Handle sizing mode
             has_height = 'height' in panel_kwargs
@@ -254,7 +296,9 @@ class Component(param.Parameterized):
             # Apply custom attributes
             for attr, value in custom_attrs.items():
                 setattr(view, attr, value)
-            
+
+            if cache:
+                self.view_cache[view_key] = view
             return view
 
         return wrapper
\ No newline at end of file
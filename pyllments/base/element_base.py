@@ -212,7 +212,9 @@ class Element(Component):
         if default_css:
             current_stylesheets = getattr(view, 'stylesheets', [])
             if isinstance(current_stylesheets, list):
-                view.stylesheets = [default_css] + current_stylesheets
+                # Views reused by the Payload already carry the default CSS
+                if default_css not in current_stylesheets:
+                    view.stylesheets = [default_css] + current_stylesheets
             else:
                 view.stylesheets = [default_css, current_stylesheets]
         
@@ -24,6 +24,13 @@ class Collection(param.Parameterized):
     def add_items(self, items: list[dict]):
         pass
 
+    def add_table(self, table: pa.Table):
+        """
+        Adds the rows of an Arrow table to the collection. Falls back to
+        add_items; subclasses with native Arrow support should override this.
+        """
+        self.add_items(table.to_pylist())
+
 default_lance_db_schema = pa.schema([
     pa.field('text', pa.string()),
     pa.field('embedding', pa.list_(pa.float32(), 768)),
@@ -63,7 +70,12 @@ class LanceDBCollection(Collection):
 
     def add_items(self, items: list[dict]):
         """Adds items to the collection"""
-        self.collection.add(items)
+        # Converted against the known schema rather than having LanceDB infer it
+        self.collection.add(pa.Table.from_pylist(items, schema=self.schema))
+
+    def add_table(self, table: pa.Table):
+        """Adds the rows of an Arrow table matching the schema to the collection"""
+        self.collection.add(table)
 
     def query(self, embedding: np.ndarray, n: int = None, metric: str = None):
         """Queries the collection. If n or metric are not provided, uses the class defaults"""
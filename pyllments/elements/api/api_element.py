@@ -235,7 +235,7 @@ class APIElement(Element):
 
             # Set the response future if we have a return dictionary
             if return_dict:
-                logger.info(f"[APIElement] Setting response future to {return_dict}")
+                logger.info("[APIElement] Setting response future to {}", return_dict)
                 if self.response_future and not self.response_future.done():
                     self.response_future.set_result(return_dict)
                 else:
@@ -266,7 +266,7 @@ class APIElement(Element):
         # async def post_return(item: dict):
             item = item.dict()
             # Check if there's already a request being processed
-            logger.info(f"[APIElement] Request received: {item}")
+            logger.info("[APIElement] Request received: {}", item)
             if self.response_future and not self.response_future.done():
                 raise HTTPException(
                     status_code=429, 
@@ -42,13 +42,11 @@ class ChatInterfaceElement(Element):
         self._message_input_setup()
         self._message_emit_input_setup()
     def _message_output_setup(self):
-        """Sets up the output message port"""
-        def pack(new_message: MessagePayload) -> MessagePayload:
-            return new_message
-
+        """Sets up the output message port - the staged message is the payload"""
         self.ports.add_output(
             name='message_output',
-            pack_payload_callback=pack)
+            payload_type=MessagePayload,
+            pass_through='new_message')
     
     def _message_input_setup(self):
         """Sets up the input message port - does not emit from the message_output port"""
@@ -97,7 +95,7 @@ class ChatInterfaceElement(Element):
                 )
             )
         # This watcher should be called before the payload starts streaming.
-        self.model.param.watch(_update_chatfeed, 'new_message', precedence=0)
+        self.watch_for_view(self.model, _update_chatfeed, 'new_message', precedence=0)
         return self.chatfeed_view
 
     @Component.view
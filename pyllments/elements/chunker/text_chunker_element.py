@@ -27,7 +27,7 @@ class TextChunkerElement(Element):
         self.ports.add_input(name='file_input', unpack_payload_callback=unpack)
 
     def _chunk_output_setup(self):
-        def pack(chunks: list[ChunkPayload]) -> list[ChunkPayload]:
-            return chunks
-        
-        self.ports.add_output(name='chunk_output', pack_payload_callback=pack)
\ No newline at end of file
+        self.ports.add_output(
+            name='chunk_output',
+            payload_type=list[ChunkPayload],
+            pass_through='chunks')
\ No newline at end of file
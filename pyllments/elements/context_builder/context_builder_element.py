@@ -171,10 +171,10 @@ class ContextBuilder(Element):
                 
                 # Always store the incoming payload
                 input_name_payload_dict[active_input_port.name] = active_input_port.payload
-                logger.info(f"[ContextBuilder] Set payload on port {active_input_port.name}: {type(active_input_port.payload)}")
+                logger.info("[ContextBuilder] Set payload on port {}: {}", active_input_port.name, type(active_input_port.payload))
                 if c.get('is_ready', True):
                     if active_input_port.name in self.build_map:
-                        logger.info(f"[ContextBuilder] Building messages for {active_input_port.name}: {self.build_map[active_input_port.name]}")
+                        logger.info("[ContextBuilder] Building messages for {}: {}", active_input_port.name, self.build_map[active_input_port.name])
                         required_ports = self.build_map[active_input_port.name]
                         input_port_keys_subset = [key for key in required_ports if key in input_port_keys]
                         c['required_ports'] = required_ports
@@ -208,7 +208,7 @@ class ContextBuilder(Element):
                     for key in required_ports:
                         input_name_payload_dict.pop(key, None)
                     c['is_ready'] = True
-                    logger.info(f"[ContextBuilder] Emitting ports: {required_ports}")
+                    logger.info("[ContextBuilder] Emitting ports: {}", required_ports)
                     messages_output.emit(msg_payload_list)
             # Default behavior without build_map or build_fn
             # Waits for all payloads to be received and then emits the messages in the order of the input_map
@@ -220,7 +220,7 @@ class ContextBuilder(Element):
                 )
                 input_name_payload_dict = c.setdefault('input_name_payload_dict', {})
                 input_name_payload_dict[active_input_port.name] = active_input_port.payload
-                logger.info(f"[ContextBuilder] Set payload on port {active_input_port.name}: {type(active_input_port.payload)}")
+                logger.info("[ContextBuilder] Set payload on port {}: {}", active_input_port.name, type(active_input_port.payload))
 
                 # Convert to MessagePayloads or lists of MessagePayloads, then emit all of them
                 if all([key in input_name_payload_dict for key in input_port_keys]):
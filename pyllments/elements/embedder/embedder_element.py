@@ -32,10 +32,10 @@ class EmbedderElement(Element):
         self.ports.add_input(name='chunk_input', unpack_payload_callback=process_chunks)
 
     def _processed_chunks_output_setup(self):
-        def pack(processed_chunks: list[ChunkPayload]) -> list[ChunkPayload]:
-            return processed_chunks
-
-        self.ports.add_output(name='processed_chunks_output', pack_payload_callback=pack)
+        self.ports.add_output(
+            name='processed_chunks_output',
+            payload_type=list[ChunkPayload],
+            pass_through='processed_chunks')
 
     def _message_input_setup(self):
         def process_message(message_payload: MessagePayload):
@@ -45,7 +45,7 @@ class EmbedderElement(Element):
         self.ports.add_input(name='message_input', unpack_payload_callback=process_message)
 
     def _processed_message_output_setup(self):
-        def pack(processed_message: MessagePayload) -> MessagePayload:
-            return processed_message
-
-        self.ports.add_output(name='processed_message_output', pack_payload_callback=pack)
\ No newline at end of file
+        self.ports.add_output(
+            name='processed_message_output',
+            payload_type=MessagePayload,
+            pass_through='processed_message')
\ No newline at end of file
@@ -39,7 +39,7 @@ class EmbedderModel(Model):
         Embed a list of messages and return the processed messages with embeddings.
         """
         
-        embed_list = self.encoder_model.encode([message.model.message.content for message in messages])
+        embed_list = self.encoder_model.encode([message.model.content for message in messages])
         for message, embedding in zip(messages, embed_list):
             message.model.embedding = embedding
         return messages
@@ -20,10 +20,10 @@ class FileLoaderElement(Element):
         self._file_output_setup()
 
     def _file_output_setup(self):
-        def pack(file_list: list[FilePayload]) -> list[FilePayload]:
-            return file_list
-        
-        self.ports.add_output('file_list_output', pack)
+        self.ports.add_output(
+            name='file_list_output',
+            payload_type=list[FilePayload],
+            pass_through='file_list')
 
     @Component.view
     def create_file_input_view(self, input_css: list = [], sizing_mode: str = 'stretch_width', width: int = None):
@@ -2,6 +2,7 @@ from collections import UserDict
 import param
 from typing import Any
 import asyncio
+import inspect
 
 from pyllments.base.element_base import Element
 from pyllments.base.payload_base import Payload
@@ -194,8 +195,14 @@ class FlowController(Element):
         super().__init__(**params)
         if self.containing_element:
             self.ports = Ports(containing_element=self.containing_element)
+        self._set_flow_fn_is_async()
         self._setup_ports()
 
+    @param.depends('flow_fn', watch=True)
+    def _set_flow_fn_is_async(self):
+        """Checked once per flow_fn rather than inspecting every result"""
+        self._flow_fn_is_async = inspect.iscoroutinefunction(self.flow_fn)
+
     def _setup_ports(self):
         for io_type in ['input', 'output']:
             if io_type not in self.flow_map:
@@ -247,26 +254,29 @@ class FlowController(Element):
             self.flow_port_map[alias] = {}
             return
         
+        # The flow port is resolved here rather than from the alias per payload
         def unpack(payload: payload_type):
-            self._invoke_flow(alias, payload)
+            self._invoke_flow(input_flow_port, payload)
         
         input_port = self.ports.add_input(alias, unpack_payload_callback=unpack)
         
-        self.flow_port_map[alias] = InputFlowPort(
+        input_flow_port = InputFlowPort(
             name=alias,
             payload_type=payload_type,
             input_port=input_port
         )
+        self.flow_port_map[alias] = input_flow_port
 
     def _setup_output_port(self, alias, payload_type):
         if alias.startswith('multi_'):
             self.flow_port_map[alias] = {}
             return
 
-        def pack(payload: payload_type) -> payload_type:
-            return payload
-        
-        output_port = self.ports.add_output(alias, pack_payload_callback=pack)
+        # The payload emitted by the flow port passes straight through
+        output_port = self.ports.add_output(
+            alias,
+            payload_type=payload_type,
+            pass_through=True)
         
         self.flow_port_map[alias] = OutputFlowPort(
             name=alias,
@@ -295,7 +305,7 @@ class FlowController(Element):
 
         port_type = self.flow_map['input'][alias]
         def unpack(payload: port_type):
-            self._invoke_flow(port_alias, payload)
+            self._invoke_flow(input_flow_port, payload)
 
         input_port = self.ports.add_input(port_alias, unpack_payload_callback=unpack)
         other_output_port.connect(input_port)
@@ -309,27 +319,7 @@ class FlowController(Element):
         self.flow_port_map[alias][port_alias] = input_flow_port
         return input_flow_port
 
-    def _invoke_flow(self, input_port_name: str, payload):
-        is_multi = input_port_name.startswith('multi_')
-        if is_multi:
-            # Make sure to extract alias from port name
-            num_suffix = input_port_name.rsplit('_')[-1]
-            suffix_idx = input_port_name.rfind(num_suffix)
-            alias = input_port_name[:suffix_idx]
-            try:
-                flow_multi_port = self.flow_port_map[alias]
-            except KeyError:
-                raise KeyError(f"No flow port found with alias '{alias}'.")
-            try:
-                flow_port = flow_multi_port[input_port_name]
-            except KeyError:
-                raise KeyError(f"No flow port found in {alias} with name '{input_port_name}'.")
-        else:
-            try:
-                flow_port = self.flow_port_map[input_port_name]
-            except KeyError:
-                raise KeyError(f"No flow port found with alias '{input_port_name}'.")
-
+    def _invoke_flow(self, flow_port: InputFlowPort, payload):
         flow_port.payload = payload
         result = self.flow_fn(
             active_input_port=flow_port,
@@ -337,14 +327,13 @@ class FlowController(Element):
             **self.flow_port_map.list_view()
         )
 
-        # If result is a coroutine/task, create a task that waits for it before clearing
-        if asyncio.iscoroutine(result) or isinstance(result, asyncio.Task):
-            async def clear_after_complete():
-                try:
-                    await result
-                finally:
-                    flow_port.payload = None
-            asyncio.create_task(clear_after_complete())
+        # If result is awaitable, clear once it completes. Coroutines are
+        # wrapped in a single task and futures are used as-is, rather than
+        # scheduling an extra waiter task around them.
+        if self._flow_fn_is_async or inspect.isawaitable(result):
+            def clear_after_complete(task):
+                flow_port.payload = None
+            asyncio.ensure_future(result).add_done_callback(clear_after_complete)
         else:
             # Synchronous case - clear immediately as before
             flow_port.payload = None
@@ -365,10 +354,10 @@ class FlowController(Element):
             port_alias_num = int(port_alias.rsplit('_')[-1])
             port_alias = f"{alias}_{port_alias_num + 1}"
         port_type = self.flow_map['output'][alias]
-        def pack(payload: port_type) -> port_type:
-            return payload
-
-        output_port = self.ports.add_output(port_alias, pack_payload_callback=pack)
+        output_port = self.ports.add_output(
+            port_alias,
+            payload_type=port_type,
+            pass_through=True)
         self.ports.output[port_alias].connect(other_input_port)
 
         output_flow_port = OutputFlowPort(
@@ -2,20 +2,20 @@ from typing import Callable
 
 import param
 
-from pyllments.elements.flow_control.flow_controller import FlowController
-from pyllments.ports import Ports, OutputPort
+from pyllments.elements.flow_control.flow_controller import FlowController, OutputFlowPort
+from pyllments.ports import Ports, InputPort, OutputPort
 
 class Router(param.Parameterized):
     """
     The Router class facilitates the routing of payloads between different flow ports in a flow control system.
-    It acts as a mediator that connects input ports to multiple output ports based on a specified key.
+    It acts as a mediator that routes payloads from an output port to one of several input ports based on a key.
 
     Parameters:
     -----------
-    key_port_map : Dict[Any, OutputPort]
-        A dictionary mapping keys to output ports. All output ports must have the same payload type.
+    key_port_map : Dict[Any, InputPort]
+        A dictionary mapping keys to the input ports to route to. All ports must have the same payload type.
     payload_key_fn : Callable
-        A function that takes a payload as input and returns a key to determine which output port to use.
+        A function that takes a payload as input and returns the key of the input port in key_port_map to route to.
     incoming_output_port : OutputPort, optional
         An optional output port to connect to the router's input upon initialization.
 
@@ -25,15 +25,15 @@ class Router(param.Parameterized):
         The underlying FlowController managing the routing logic.
     input_payload_type : Type
         The payload type of the input port, inferred from the key_port_map.
-    key_flow_port_map : Dict[Any, OutputPort]
+    key_flow_port_map : Dict[Any, OutputFlowPort]
         A mapping of keys to the actual flow output ports created by the router.
 
     Usage:
     ------
     router = Router(
         key_port_map={
-            'key1': output_port1,
-            'key2': output_port2,
+            'key1': element1.ports.input['some_input'],
+            'key2': element2.ports.input['some_input'],
             # ...
         },
         payload_key_fn=lambda payload: payload.get_key(),
@@ -45,16 +45,16 @@ class Router(param.Parameterized):
 
     Note:
     -----
-    - All output ports in key_port_map must have the same payload type.
+    - All ports in key_port_map must have the same payload type.
     - The payload_key_fn should return a key that exists in the key_port_map.
     """
 
     key_port_map = param.Dict(allow_None=False, doc="""
-        A dictionary mapping keys to output ports. All output ports must have the same payload type.
-        Example: {'key1': output_port1, 'key2': output_port2}""")
+        A dictionary mapping keys to the input ports to route to. All ports must have the same payload type.
+        Example: {'key1': input_port1, 'key2': input_port2}""")
     
     payload_key_fn = param.Callable(allow_None=False, doc="""
-        A function that takes a payload as input and returns a key to determine which output port to use.
+        A function that takes a payload as input and returns the key of the input port in key_port_map to route to.
         Example: lambda payload: payload.get_key()""")
 
 
@@ -63,7 +63,7 @@ class Router(param.Parameterized):
     
     input_payload_type = param.Parameter(doc="The payload type of the input port, inferred from the key_port_map.")
     
-    key_flow_port_map = param.Dict(doc="""
+    key_flow_port_map = param.Dict(default={}, doc="""
         A mapping of keys to the actual flow output ports created by the router.""")
     
     incoming_output_port = param.ClassSelector(class_=OutputPort, doc="""
@@ -106,27 +106,27 @@ class Router(param.Parameterized):
         self.flow_controller = FlowController(flow_fn=flow_fn, flow_map=flow_map)
         
         for key, port in self.key_port_map.items():
-            flow_output_port = self.flow_controller.connect('multi_output', port)
+            flow_output_port = self.flow_controller.connect_output('multi_output', port)
             self.key_flow_port_map[key] = flow_output_port
      
-    def _input_payload_type_set(self, key_port_map: dict[str, OutputPort]):
+    def _input_payload_type_set(self, key_port_map: dict[str, InputPort]):
         """
         Set the input payload type based on the key_port_map.
 
         Parameters:
         -----------
-        key_port_map : Dict[str, OutputPort]
-            The dictionary mapping keys to output ports.
+        key_port_map : Dict[str, InputPort]
+            The dictionary mapping keys to input ports.
 
         Raises:
         -------
         ValueError
-            If all output ports in the key_port_map don't have the same payload type.
+            If all ports in the key_port_map don't have the same payload type.
         """
-        payload_type = next(iter(key_port_map.values()))
+        payload_type = next(iter(key_port_map.values())).payload_type
         for port in key_port_map.values():
             if port.payload_type != payload_type:
-                raise ValueError(f'All output ports must have the same payload type.')
+                raise ValueError('All input ports in key_port_map must have the same payload type.')
         self.input_payload_type = payload_type
 
     def _flow_fn_setup(self, flow_map: dict) -> Callable:
@@ -143,10 +143,19 @@ class Router(param.Parameterized):
         Callable
             The flow function to be used by the FlowController.
         """
-        def flow_fn(payload_input, multi_output, c, active_input_port):
-            key = self.payload_key_fn(active_input_port.payload)
-            self.key_flow_port_map[key].emit(active_input_port.payload)
+        # Bound once rather than looked up on self for every payload.
+        # The flow port map is filled in place as outputs are connected.
+        payload_key_fn = self.payload_key_fn
+        key_flow_port_map = self.key_flow_port_map
+
+        def flow_fn(active_input_port, c, **kwargs):
+            payload = active_input_port.payload
+            key_flow_port_map[payload_key_fn(payload)].emit(payload)
         return flow_fn
+
+    @param.depends('payload_key_fn', watch=True)
+    def _rebind_flow_fn(self):
+        self.flow_controller.flow_fn = self._flow_fn_setup(self.flow_controller.flow_map)
     
     def connect_input(self, output_port: OutputPort):
         """
@@ -157,4 +166,4 @@ class Router(param.Parameterized):
         output_port : OutputPort
             The output port to connect to the router's input.
         """
-        self.flow_controller.connect('payload_input', output_port)
+        self.flow_controller.connect_input('payload_input', output_port)
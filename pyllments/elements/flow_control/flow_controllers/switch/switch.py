@@ -96,9 +96,12 @@ class Switch(Element):
         flow_map = self._prepare_flow_map()
         connected_flow_map = self._prepare_connected_flow_map()
 
+        # Resolved when current_output changes rather than on every payload
+        active_flow_port = None
+
         def flow_fn(active_input_port, c, **kwargs):
-            if self.current_output in kwargs:
-                kwargs[self.current_output].emit(active_input_port.payload)
+            if active_flow_port is not None:
+                active_flow_port.emit(active_input_port.payload)
 
         self.flow_controller = FlowController(
             containing_element=self,
@@ -114,6 +117,13 @@ class Switch(Element):
         if not self.current_output and self.outputs:
             self.current_output = self.outputs[0]
 
+        def _bind_active_flow_port(event=None):
+            nonlocal active_flow_port
+            active_flow_port = self.flow_controller.flow_port_map.get(self.current_output)
+
+        _bind_active_flow_port()
+        self.param.watch(_bind_active_flow_port, 'current_output')
+
     def _prepare_flow_map(self):
         flow_map = {'input': {'payload_input': self.payload_type}, 'output': {}}
         for output in self.outputs:
@@ -65,13 +65,10 @@ class HistoryHandlerElement(Element):
         self.ports.add_input(name='messages_input', unpack_payload_callback=unpack)
 
     def _messages_output_setup(self):
-        def pack(context: list[MessagePayload]) -> list[MessagePayload]:
-            return context
-        
         self.ports.add_output(
             name='messages_output',
-            pack_payload_callback=pack
-        )
+            payload_type=list[MessagePayload],
+            pass_through='context')
 
     @Component.view
     def create_context_view(
@@ -105,25 +102,16 @@ class HistoryHandlerElement(Element):
         )
 
         async def _update_context_view(event):
-            current_len = len(self.model.context)
-            container_len = len(self.context_container.objects)
-            
-            # If messages were removed from the start (sliding window)
-            while container_len > current_len:
-                del self.context_container.objects[0]  # Remove from start
-                container_len -= 1
-            
-            # Add any new messages at the end
-            if current_len > container_len:
-                # Use islice to efficiently get only the new messages
-                new_views = [
-                    msg[0].create_collapsible_view()
-                    for msg in islice(self.model.context, container_len, None)
-                ]
-                self.context_container.extend(new_views)
-            
-            # Ensure visual update
-            self.context_container.param.trigger('objects')
+            objects = self.context_container.objects
+            # Drop views of messages removed from the start (sliding window)
+            kept_views = objects[max(len(objects) - len(self.model.context), 0):]
+            # Use islice to efficiently get only the new messages
+            new_views = [
+                msg[0].create_collapsible_view()
+                for msg in islice(self.model.context, len(kept_views), None)
+            ]
+            # A single assignment so the removals and additions render as one update
+            self.context_container.objects = kept_views + new_views
 
-        self.model.param.watch(_update_context_view, 'context')
+        self.watch_for_view(self.model, _update_context_view, 'context')
         return self.context_view
\ No newline at end of file
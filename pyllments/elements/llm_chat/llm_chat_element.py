@@ -20,10 +20,10 @@ class LLMChatElement(Element):
         self._messages_input_setup()
         
     def _message_output_setup(self):
-        def pack(message_payload: MessagePayload) -> MessagePayload:
-            return message_payload
-            
-        self.ports.add_output(name='message_output', pack_payload_callback=pack)
+        self.ports.add_output(
+            name='message_output',
+            payload_type=MessagePayload,
+            pass_through='message_payload')
 
     def _messages_input_setup(self):
         def unpack(payload: Union[list[MessagePayload], MessagePayload]):
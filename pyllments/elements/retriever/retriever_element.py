@@ -1,5 +1,5 @@
-import time
-from typing import Union
+import asyncio
+from typing import Callable, Union
 
 from loguru import logger
 import panel as pn
@@ -14,45 +14,93 @@ from pyllments.elements.retriever.retriever_model import RetrieverModel
 class RetrieverElement(Element):
     retrieved_chunks_view = param.ClassSelector(class_=pn.Column)
     created_chunks_view = param.ClassSelector(class_=pn.Column)
+    view_update_delay = param.Number(default=0.05, bounds=(0, None), doc="""
+        Seconds to wait before refreshing a chunks view, so that rapid
+        successive updates to the chunks are rendered once""")
 
     def __init__(self, **params):
         super().__init__(**params)
-        self.model = RetrieverModel(**params)
+        # Element-only params such as view_update_delay aren't passed on
+        self.model = RetrieverModel(
+            **{k: v for k, v in params.items() if k in RetrieverModel.param})
+        self._pending_view_refreshes = set()
+        self._retrieval_tasks = set()
 
         self._chunk_input_setup()
-        self._message_query_input_setup()
+        # The output port is bound by the message_input callbacks
         self._chunk_result_output_setup()
+        self._message_query_input_setup()
+
+    def close(self):
+        """
+        Cancels running retrievals and closes the model, writing the chunks
+        it still buffers
+        """
+        for task in tuple(self._retrieval_tasks):
+            task.cancel()
+        self.model.close()
+
+    async def aclose(self):
+        """Closes like close, without blocking the event loop on the writes"""
+        for task in tuple(self._retrieval_tasks):
+            task.cancel()
+        await self.model.aclose()
 
     def _chunk_input_setup(self):
         """For the collection populating process"""
         def unpack(payload: Union[ChunkPayload, list[ChunkPayload]]):
-            start_time = time.time()
-            logger.info("RetrieverElement: Starting chunk input processing")
-            chunks = payload if isinstance(payload, list) else [payload]
-            self.model.add_items(chunks)  # Use add_items to process all chunks at once
-            logger.info(f"RetrieverElement: Finished processing {len(chunks)} chunks. Total time: {time.time() - start_time:.2f} seconds")
+            if isinstance(payload, list):
+                self.model.add_items(payload)  # Use add_items to process all chunks at once
+            else:
+                self.model.add_item(payload)  # Buffered and written in batches by the model
         
         self.ports.add_input('chunk_input', unpack)
 
+        def unpack_chunks(payload: list[ChunkPayload]):
+            self.model.add_items(payload)
+
+        # For producers that always emit lists of chunks
+        self.ports.add_input('chunks_input', unpack_chunks)
+
     def _message_query_input_setup(self):
         """The input query used for retrieval"""
-        def unpack(payload: MessagePayload):
-            start_time = time.time()
-            logger.info("RetrieverElement: Starting retrieval process")
-            chunks = self.model.retrieve(payload)
-            logger.info(f"RetrieverElement: Retrieval completed. Time elapsed: {time.time() - start_time:.2f} seconds")
+        stage_emit_chunks = self.ports.output['chunk_output'].stage_emit
+
+        def emit_chunks(chunks: list[ChunkPayload]):
             if chunks:
-                self.ports.output['chunk_output'].stage_emit(chunk_payload=chunks)
-                logger.info(f"RetrieverElement: Chunks staged for emission. Time elapsed: {time.time() - start_time:.2f} seconds")
+                stage_emit_chunks(chunk_payload=chunks)
+
+        async def retrieve_and_emit(payload: MessagePayload):
+            emit_chunks(await self.model.aretrieve(payload))
+
+        def retrieval_done(task: asyncio.Task):
+            self._retrieval_tasks.discard(task)
+            if not task.cancelled() and task.exception() is not None:
+                logger.opt(exception=task.exception()).error(
+                    "RetrieverElement: Failed to retrieve chunks")
+
+        def unpack(payload: MessagePayload):
+            try:
+                asyncio.get_running_loop()
+            except RuntimeError:
+                emit_chunks(self.model.retrieve(payload))
+                return
+            # Raised to the sender here rather than inside the task
+            self.model.get_query_embedding(payload)
+            # Keeps the loop free while the collection is queried
+            task = asyncio.create_task(retrieve_and_emit(payload))
+            self._retrieval_tasks.add(task)
+            task.add_done_callback(retrieval_done)
         
         self.ports.add_input('message_input', unpack)
 
     def _chunk_result_output_setup(self):
         """The output of the retrieval process"""
-        def pack(chunk_payload: list[ChunkPayload]) -> list[ChunkPayload]:
-            return chunk_payload
-        
-        self.ports.add_output('chunk_output', pack)
+        # The staged chunks pass straight through as the payload
+        self.ports.add_output(
+            'chunk_output',
+            payload_type=list[ChunkPayload],
+            pass_through='chunk_payload')
 
     @Component.view
     def create_retrieved_chunks_view(
@@ -66,10 +114,9 @@ class RetrieverElement(Element):
         title_visible: bool = True
     ) -> pn.Column:
         """Creates a view for displaying the retrieved chunks."""
-        self.retrieved_chunks_container = pn.Column(*[
-                chunk.create_collapsible_view()
-                for chunk in self.model.retrieved_chunks
-            ],
+        chunk_views = {}
+        self.retrieved_chunks_container = pn.Column(
+            *self._get_chunk_views(self.model.retrieved_chunks, chunk_views),
             scroll=True,
             sizing_mode='stretch_both',
             stylesheets=container_css
@@ -100,14 +147,14 @@ class RetrieverElement(Element):
             scroll=False
         )
         
+        def _refresh_retrieved_chunks_view():
+            self.retrieved_chunks_container.objects = self._get_chunk_views(
+                self.model.retrieved_chunks, chunk_views)
+
         def _update_retrieved_chunks_view(event):
-            self.retrieved_chunks_container.objects = [
-                chunk.create_collapsible_view()
-                for chunk in self.model.retrieved_chunks
-            ]
-            self.retrieved_chunks_view.param.trigger('objects')
+            self._schedule_view_refresh(_refresh_retrieved_chunks_view)
         
-        self.model.param.watch(_update_retrieved_chunks_view, 'retrieved_chunks')
+        self.watch_for_view(self.model, _update_retrieved_chunks_view, 'retrieved_chunks')
         return self.retrieved_chunks_view
 
     @Component.view
@@ -122,10 +169,9 @@ class RetrieverElement(Element):
         title_visible: bool = True
     ) -> pn.Column:
         """Creates a view for displaying the created chunks."""
-        self.created_chunks_container = pn.Column(*[
-                chunk.create_collapsible_view()
-                for chunk in self.model.created_chunks
-            ],
+        chunk_views = {}
+        self.created_chunks_container = pn.Column(
+            *self._get_chunk_views(self.model.created_chunks, chunk_views),
             scroll=True,
             sizing_mode='stretch_both',
             stylesheets=container_css
@@ -154,13 +200,48 @@ class RetrieverElement(Element):
             scroll=False
         )
         
+        def _refresh_created_chunks_view():
+            self.created_chunks_container.objects = self._get_chunk_views(
+                self.model.created_chunks, chunk_views)
+
         def _update_created_chunks_view(event):
-            self.created_chunks_container.objects = [
-                chunk.create_collapsible_view()
-                for chunk in self.model.created_chunks
-            ]
-            self.created_chunks_view.param.trigger('objects')
+            self._schedule_view_refresh(_refresh_created_chunks_view)
         
-        self.model.param.watch(_update_created_chunks_view, 'created_chunks')
+        self.watch_for_view(self.model, _update_created_chunks_view, 'created_chunks')
+
+        return self.created_chunks_view
+
+    @staticmethod
+    def _get_chunk_views(chunks: list[ChunkPayload], chunk_views: dict) -> list[pn.Row]:
+        """
+        Returns the views of the chunks, only creating views for chunks that
+        aren't in chunk_views already. chunk_views is updated to hold exactly
+        the returned views.
+        """
+        views = {
+            chunk: chunk_views[chunk] if chunk in chunk_views else chunk.create_collapsible_view()
+            for chunk in chunks
+        }
+        chunk_views.clear()
+        chunk_views.update(views)
+        return list(views.values())
+
+    def _schedule_view_refresh(self, refresh: Callable[[], None]):
+        """
+        Runs refresh after view_update_delay, coalescing repeated requests
+        made in the meantime. Runs it immediately without an event loop.
+        """
+        if refresh in self._pending_view_refreshes:
+            return
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            refresh()
+            return
+
+        def run_refresh():
+            self._pending_view_refreshes.discard(refresh)
+            refresh()
 
-        return self.created_chunks_view
\ No newline at end of file
+        self._pending_view_refreshes.add(refresh)
+        loop.call_later(self.view_update_delay, run_refresh)
@@ -1,26 +1,45 @@
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+import operator
+
+import numpy as np
 import param
 import pyarrow as pa
 import time
 from loguru import logger
 
 from pyllments.base.model_base import Model
-from pyllments.common.collections import LanceDBCollection, Collection
+from pyllments.common.collections import LanceDBCollection, Collection, default_lance_db_schema
 # from pyllments.common.tokenizers import get_token_len
 from pyllments.payloads.chunk import ChunkPayload
 from pyllments.payloads.message import MessagePayload
 
-
-default_lance_db_schema = pa.schema([
-    pa.field('text', pa.string()),
-    pa.field('embedding', pa.list_(pa.float32(), 768)),
-    pa.field('source_filepath', pa.string()),
-    pa.field('start_idx', pa.int32()),
-    pa.field('end_idx', pa.int32())
-])
-
 def pa_schema_to_col_list(schema: pa.Schema):
     return schema.empty_table().column_names
 
+
+def pa_field_to_array_builder(field: pa.Field):
+    """
+    Returns a function building an Arrow array for the field from a sequence
+    of values. Fixed size list columns (the embeddings) are stacked into one
+    contiguous NumPy array and wrapped without converting each value to a
+    Python object.
+    """
+    if pa.types.is_fixed_size_list(field.type):
+        dtype = field.type.value_type.to_pandas_dtype()
+        list_size = field.type.list_size
+
+        def build_fixed_size_list(values) -> pa.Array:
+            flat_values = np.asarray(values, dtype=dtype).reshape(-1)
+            return pa.FixedSizeListArray.from_arrays(pa.array(flat_values), list_size)
+        return build_fixed_size_list
+
+    field_type = field.type
+
+    def build(values) -> pa.Array:
+        return pa.array(values, type=field_type)
+    return build
+
 class RetrieverModel(Model):
     collection = param.ClassSelector(class_=Collection, doc="""
         The collection to retrieve from. Based on a a DB backend for storage""")
@@ -49,6 +68,13 @@ class RetrieverModel(Model):
         The chunks retrieved from the collection""")
     created_chunks = param.List(item_type=ChunkPayload, doc="""
         The chunks created by the model""")
+    batch_threshold = param.Integer(default=64, bounds=(1, None), doc="""
+        The amount of chunks add_item buffers before writing them to the
+        collection in a single batch""")
+    flush_interval = param.Number(default=0.5, bounds=(0, None), doc="""
+        Seconds after the first buffered chunk before a partial batch is written.
+        Only applies while an event loop is running - otherwise add_item writes
+        immediately.""")
 
     def __init__(self, retrieval_token_limit=None, **params):
         super().__init__(**params)
@@ -56,46 +82,166 @@ class RetrieverModel(Model):
             # Uses default param-generated RetrievelModel name if not set
             self.collection_name = self.name
 
-        self.schema_cols = pa_schema_to_col_list(self.schema)
+        self._set_schema_layout()
         self.collection = LanceDBCollection(
             url=self.url,
             collection_name=self.collection_name,
             schema=self.schema
         )
+        self._pending_chunks = []
+        self._flush_handle = None
+        # A single worker keeps the collection's writes and queries in order
+        self._executor = ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix=f"{self.collection_name}_io")
     
+    @param.depends('schema', watch=True)
+    def _set_schema_layout(self):
+        """
+        Resolves how rows are read from chunks and how each column is built,
+        so chunks_to_table doesn't inspect the schema on every call
+        """
+        self.schema_cols = pa_schema_to_col_list(self.schema)
+        # Read with a single C-level call per chunk
+        self._schema_cols = tuple(self.schema_cols)
+        row_getter = operator.attrgetter(*self._schema_cols)
+        # attrgetter only returns a tuple when given more than one attribute
+        self._row_getter = (
+            row_getter if len(self._schema_cols) > 1
+            else lambda model: (row_getter(model),))
+        self._array_builders = tuple(
+            pa_field_to_array_builder(field) for field in self.schema)
+
     def add_item(self, chunk_payload: ChunkPayload):
-        start_time = time.time()
-        
-        item = {col: getattr(chunk_payload.model, col) for col in self.schema_cols}
-        self.collection.add_item(item)
+        """
+        Buffers a chunk for the collection. The buffer is written as one batch
+        once batch_threshold is reached or flush_interval has passed.
+        """
+        self._pending_chunks.append(chunk_payload)
+        if len(self._pending_chunks) >= self.batch_threshold:
+            self.flush()
+        elif self._flush_handle is None:
+            try:
+                loop = asyncio.get_running_loop()
+            except RuntimeError:
+                # Nothing would run a delayed flush, so write right away
+                self.flush()
+            else:
+                self._flush_handle = loop.call_later(self.flush_interval, self.flush)
 
-        logger.info(f"RetrieverModel: Added item to collection. Time elapsed: {time.time() - start_time:.2f} seconds")
+    def flush(self) -> asyncio.Future | None:
+        """
+        Writes any chunks buffered by add_item to the collection. Returns the
+        future of the write when it is queued within a running event loop.
+        """
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+        if self._pending_chunks:
+            chunk_payloads, self._pending_chunks = self._pending_chunks, []
+            return self.add_items(chunk_payloads)
+        return None
 
-    def add_items(self, chunk_payloads: list[ChunkPayload]):
-        start_time = time.time()
+    def add_items(self, chunk_payloads: list[ChunkPayload]) -> asyncio.Future | None:
+        """
+        Writes the chunks to the collection. Within a running event loop the
+        write happens on the model's I/O thread and the returned future
+        completes once it is done.
+        """
+        start_time = time.perf_counter()
 
         self.created_chunks = chunk_payloads
-        
-        items = [{col: getattr(chunk_payload.model, col) for col in self.schema_cols} for chunk_payload in chunk_payloads]
-        self.collection.add_items(items)
-        
-        logger.info(f"RetrieverModel: Added {len(chunk_payloads)} items to collection. Time elapsed: {time.time() - start_time:.2f} seconds")
+        table = self.chunks_to_table(chunk_payloads)
+
+        def log_write(future: asyncio.Future = None):
+            if future is not None and future.exception() is not None:
+                logger.opt(exception=future.exception()).error(
+                    "RetrieverModel: Failed to add {} items to collection", len(chunk_payloads))
+                return
+            # Arguments are only formatted when a sink accepts INFO
+            logger.info(
+                "RetrieverModel: Added {} items to collection. Time elapsed: {:.2f} seconds",
+                len(chunk_payloads), time.perf_counter() - start_time)
+
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            # Still on the I/O thread, so it can't overlap with queued writes
+            self._executor.submit(self.collection.add_table, table).result()
+            log_write()
+            return None
+        future = loop.run_in_executor(self._executor, self.collection.add_table, table)
+        future.add_done_callback(log_write)
+        return future
     
+    def chunks_to_table(self, chunk_payloads: list[ChunkPayload]) -> pa.Table:
+        """Builds an Arrow table of the chunks column by column"""
+        row_getter = self._row_getter
+        columns = zip(*(row_getter(chunk_payload.model) for chunk_payload in chunk_payloads))
+        arrays = [build(values) for build, values in zip(self._array_builders, columns)]
+        return pa.Table.from_arrays(arrays, schema=self.schema)
+
     def retrieve(self, message_payload: MessagePayload):
-        start_time = time.time()
+        """
+        Retrieves the chunks closest to the message's embedding. The query
+        runs on the model's I/O thread after any queued writes, blocking
+        until it is done.
+        """
+        start_time = time.perf_counter()
+        embedding = self.get_query_embedding(message_payload)
+        items = self._executor.submit(self._query, embedding).result()
+        return self._set_retrieved_chunks(items, start_time)
+
+    async def aretrieve(self, message_payload: MessagePayload) -> list[ChunkPayload]:
+        """
+        Retrieves like retrieve, running the query on the model's I/O thread
+        so the event loop isn't blocked. Queued writes complete first.
+        """
+        start_time = time.perf_counter()
+        embedding = self.get_query_embedding(message_payload)
+        items = await asyncio.get_running_loop().run_in_executor(
+            self._executor, self._query, embedding)
+        return self._set_retrieved_chunks(items, start_time)
+
+    def close(self):
+        """
+        Writes the buffered chunks, then shuts down the model's I/O thread once
+        queued writes and queries are done. The model can't access the
+        collection afterwards.
+        """
+        self.flush()
+        self._executor.shutdown(wait=True)
+
+    async def aclose(self):
+        """Closes like close, without blocking the event loop on the writes"""
+        write = self.flush()
+        if write is not None:
+            await write
+        # Queries still queued run before the thread exits
+        self._executor.shutdown(wait=False)
+
+    def get_query_embedding(self, message_payload: MessagePayload):
+        """
+        Returns the embedding of the message to query with, flushing buffered
+        chunks first. Raises a ValueError if the message has no embedding.
+        """
+        # Buffered chunks should be searchable
+        self.flush()
         embedding = message_payload.model.embedding
         if embedding is None:
             raise ValueError("No embedding found in MessagePayload")
-        logger.info("RetrieverModel: Starting query")
-        chunk_payloads = [
-            ChunkPayload(**item)
-            for item in self.collection.query(
-                embedding,
-                n=self.retrieval_n,
-                metric=self.metric)
-        ]
+        return embedding
+
+    def _query(self, embedding) -> list[dict]:
+        return self.collection.query(
+            embedding,
+            n=self.retrieval_n,
+            metric=self.metric)
+
+    def _set_retrieved_chunks(self, items: list[dict], start_time: float) -> list[ChunkPayload]:
+        chunk_payloads = [ChunkPayload(**item) for item in items]
         self.retrieved_chunks = chunk_payloads
-        logger.info(f"RetrieverModel: Query completed. Time elapsed: {time.time() - start_time:.2f} seconds")
-    
+        logger.info(
+            "RetrieverModel: Retrieved {} chunks. Time elapsed: {:.2f} seconds",
+            len(chunk_payloads), time.perf_counter() - start_time)
         return chunk_payloads
     
\ No newline at end of file
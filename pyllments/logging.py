@@ -30,14 +30,11 @@ def log_staging(port: object, item_name: str, item_value: any):
         item_name (str): The name of the staged item.
         item_value (any): The value of the staged item.
     """
-    # Get the class name of the element to log its type
-    element_type = port.containing_element.__class__.__name__
-    
-    # Get the type of the staged item
-    item_type = type(item_value).__name__
-    
-    # Log the information in a single line
-    logger.info(f"Staging: {element_type} | Port: {port.name} | Staged Item: {item_name}: {item_type}")
+    # Log the information in a single line - only formatted when a sink accepts INFO
+    logger.info(
+        "Staging: {} | Port: {} | Staged Item: {}: {}",
+        port.containing_element.__class__.__name__, port.name,
+        item_name, type(item_value).__name__)
 
 def log_emit(port: object, payload: object):
     """
@@ -48,11 +45,10 @@ def log_emit(port: object, payload: object):
         port (object): The port instance emitting the payload.
         payload (object): The payload being emitted.
     """
-    # Get the class name of the element to log its type
-    element_type = port.containing_element.__class__.__name__
-    
-    # Log the information in a single line
-    logger.info(f"Emitting from {element_type} | Port: {port.name} | Payload: {type(payload).__name__}")
+    # Log the information in a single line - only formatted when a sink accepts INFO
+    logger.info(
+        "Emitting from {} | Port: {} | Payload: {}",
+        port.containing_element.__class__.__name__, port.name, type(payload).__name__)
 
 def log_receive(port: object, payload: object):
     """
@@ -63,11 +59,10 @@ def log_receive(port: object, payload: object):
         port (object): The port instance receiving the payload.
         payload (object): The payload being received.
     """
-    # Get the class name of the element to log its type
-    element_type = port.containing_element.__class__.__name__
-    
-    # Log the information in a single line
-    logger.info(f"Receiving in {element_type} | Port: {port.name} | Payload: {type(payload).__name__}")
+    # Log the information in a single line - only formatted when a sink accepts INFO
+    logger.info(
+        "Receiving in {} | Port: {} | Payload: {}",
+        port.containing_element.__class__.__name__, port.name, type(payload).__name__)
 
 def log_connect(output_port: object, input_port: object):
     """
@@ -79,4 +74,6 @@ def log_connect(output_port: object, input_port: object):
     input_element_type = input_port.containing_element.__class__.__name__
     
     # Log the information in a single line
-    logger.info(f"Connecting {input_element_type} | Port: {input_port.name} to {output_element_type} | Port: {output_port.name}")
+    logger.info(
+        "Connecting {} | Port: {} to {} | Port: {}",
+        input_element_type, input_port.name, output_element_type, output_port.name)
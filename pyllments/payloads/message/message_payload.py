@@ -1,3 +1,6 @@
+import html
+import re
+
 import param
 import panel as pn
 from typing import Literal, Optional, Generator, AsyncGenerator
@@ -9,13 +12,68 @@ from pyllments.base.payload_base import Payload
 from pyllments.payloads.message.message_model import MessageModel
 
 
+# Content matching this is handed to the Markdown renderer. Anything that
+# doesn't match renders the same as escaped text in a paragraph.
+MARKDOWN_SYNTAX = re.compile(r"""
+    [#*_`\\\[>|<$&\n]                   # Inline markers, HTML, math, entities and line breaks
+    | ~~                                # Strikethrough
+    | ^\s*(?:[-+*]|\d+[.)])(?:\s|$)     # List items
+    | ^\s*([-_=])\1{2,}\s*$             # Thematic breaks and setext heading underlines
+    | ^[ \t]                            # Any indentation, which may start a code block
+    | \w[/.] | [/.]\w                   # URLs, paths and domains, which are linkified
+    """, re.VERBOSE | re.MULTILINE)
+
+
+def is_plain_text(content: str) -> bool:
+    """Whether the content renders the same without a Markdown parse"""
+    return MARKDOWN_SYNTAX.search(content) is None
+
+
+def create_text_pane(content: str, markdown: bool = None, **params) -> pn.pane.HTML | pn.pane.Markdown:
+    """
+    Creates a Markdown pane, or a cheaper HTML pane when markdown is False.
+    markdown defaults to whether content needs Markdown. The HTML pane wraps
+    the text in a <p> so the ':host p' rules of the Markdown CSS still apply.
+    """
+    if markdown is None:
+        markdown = not is_plain_text(content)
+    if not markdown:
+        return pn.pane.HTML(f"<p>{html.escape(content)}</p>", **params)
+    return pn.pane.Markdown(content, **params)
+
+
+def set_text_pane(
+        pane: pn.pane.HTML | pn.pane.Markdown,
+        content: str,
+        container: pn.layout.ListLike,
+        markdown: bool = None,
+        **params) -> pn.pane.HTML | pn.pane.Markdown:
+    """
+    Updates a pane created by create_text_pane and returns the pane showing
+    the content. An HTML pane is updated in place while the content is plain
+    text. Otherwise it is replaced in the container by a Markdown pane
+    created with params. markdown defaults to whether content needs Markdown.
+    """
+    if markdown is None:
+        markdown = not is_plain_text(content)
+    if isinstance(pane, pn.pane.Markdown):
+        pane.object = content
+        return pane
+    if not markdown:
+        pane.object = f"<p>{html.escape(content)}</p>"
+        return pane
+    markdown_pane = pn.pane.Markdown(content, **params)
+    container.objects = [
+        markdown_pane if obj is pane else obj for obj in container.objects]
+    return markdown_pane
+
+
 class MessagePayload(Payload):
-        
     def __init__(self, **params):
         super().__init__(**params)
         self.model = MessageModel(**params)
 
-    @Component.view
+    @Component.view(cache=True)
     def create_static_view(
         self,
         user_markdown_css: list = [],
@@ -26,7 +84,7 @@ class MessagePayload(Payload):
         show_role: bool = True,
         sizing_mode: Literal['fixed', 'stretch_width', 'stretch_height', 'stretch_both'] = 'stretch_width'
         ) -> pn.Row:
-        """Creates a message container"""
+        """Creates a message container, reused for calls with the same arguments"""
         match self.model.role:
             case 'user':
                 markdown_css = user_markdown_css
@@ -45,22 +103,26 @@ class MessagePayload(Payload):
                 row_css = user_row_css
                 role_str = self.model.role.capitalize()
 
-        markdown = pn.pane.Markdown(
-            self.model.content,  # Changed from message.content
+        # Streamed content may pick up Markdown as it arrives
+        markdown = create_text_pane(
+            self.model.content,
+            markdown=self.model.mode == 'stream' or not is_plain_text(self.model.content),
             stylesheets=markdown_css)
 
         def _update_message_view(event):
-            view[0].object = self.model.content
+            nonlocal markdown
+            markdown = set_text_pane(
+                markdown, event.new, view, stylesheets=markdown_css)
         self.model.param.watch(_update_message_view, 'content')
         
         if show_role:
-            role_md = pn.pane.Markdown(role_str, stylesheets=role_css)
+            role_md = create_text_pane(role_str, markdown=False, stylesheets=role_css)
             view = pn.Row(markdown, role_md, stylesheets=row_css)
         else:
             view = pn.Row(markdown, stylesheets=row_css)
         return view
 
-    @Component.view
+    @Component.view(cache=True)
     def create_collapsible_view(
         self,
         markdown_css: list = [],
@@ -72,7 +134,7 @@ class MessagePayload(Payload):
         truncation_length: int = 65,
         sizing_mode = 'stretch_width'
         ) -> pn.Row:
-        """Creates a message container"""
+        """Creates a message container, reused for calls with the same arguments"""
         match self.model.role:
             case 'user':
                 row_css = user_row_css
@@ -94,29 +156,40 @@ class MessagePayload(Payload):
             button_style='outline',
             stylesheets=button_css)
 
-        markdown = pn.pane.Markdown(
-            self.model.content if len(self.model.content) <= truncation_length 
-            else f"{self.model.content[:truncation_length]}...",  # Add ellipsis to show truncation
+        def truncated(content: str) -> str:
+            return (content if len(content) <= truncation_length 
+                    else f"{content[:truncation_length]}...")  # Add ellipsis to show truncation
+
+        # Checked against the full content so expanding never needs a parse
+        markdown = create_text_pane(
+            truncated(self.model.content),
+            markdown=self.model.mode == 'stream' or not is_plain_text(self.model.content),
             stylesheets=markdown_css)
  
+        def show_content(content: str):
+            """Shows the content, or its truncation, based on the toggle state"""
+            nonlocal markdown
+            markdown = set_text_pane(
+                markdown,
+                content if expand_button.value else truncated(content),
+                view,
+                # Checked against the full content, as at creation
+                markdown=not is_plain_text(content),
+                stylesheets=markdown_css)
+
         def _update_message_view(event):
-            view[0].object = self.model.content
+            show_content(event.new)
         self.model.param.watch(_update_message_view, 'content')
 
         def toggle_visibility(event):
-            if event.new:  # If the toggle is activated
-                expand_button.icon = 'minus'
-                markdown.object = self.model.content
-            else:  # If the toggle is deactivated
-                expand_button.icon = 'plus'
-                markdown.object = (self.model.content if len(self.model.content) <= truncation_length 
-                                 else f"{self.model.content[:truncation_length]}...")
+            expand_button.icon = 'minus' if event.new else 'plus'
+            show_content(self.model.content)
         expand_button.param.watch(toggle_visibility, 'value')
 
         row_args = [expand_button, markdown]
         if show_role:
-            role_md = pn.pane.Markdown(
-                role_str, stylesheets=role_css)
+            role_md = create_text_pane(
+                role_str, markdown=False, stylesheets=role_css)
             row_args.append(role_md)
         view = pn.Row(
             *row_args, stylesheets=row_css,
@@ -1,7 +0,0 @@
-import param
-
-
-class Payload(param.Parameterized):
-    
-    def __init__(self, **params):
-        super().__init__(**params)
\ No newline at end of file
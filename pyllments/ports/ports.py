@@ -3,6 +3,7 @@ import inspect
 from uuid import uuid4
 
 import param
+from loguru import logger
 
 from pyllments.base.payload_base import Payload
 from pyllments.logging import log_staging, log_emit, log_receive, log_connect
@@ -121,7 +122,9 @@ class OutputPort(Port):
         The callback used to create the payload. When used in conjunction with
         infer_required_items == True, an annotated callback can replace passing in
         a payload and required_items while enabling type-checking.
-        Kwargs, their types, and the return type are required annotations.""")
+        Kwargs, their types, and the return type are required annotations.
+        When None, the port passes its single staged item through as the payload,
+        and payload_type should be passed in directly.""")
         
     staged_items = param.List(item_type=str, doc="""
         The items that have been staged and are awaiting emission""")
@@ -151,7 +154,7 @@ class OutputPort(Port):
                 for name, type_ in annotations.items()
             }
             self.type_checking = True
-        elif self.required_items and isinstance(next(iter(self.required_items)), dict):
+        elif self.required_items and isinstance(next(iter(self.required_items.values())), dict):
             self.type_checking = True
         elif self.required_items:
             self.required_items = {item: {'value': None, 'type': Any} for item in self.required_items}
@@ -159,6 +162,8 @@ class OutputPort(Port):
             # If no required_items are specified, assume a single 'payload' item of Any type
             self.required_items = {'payload': {'value': None, 'type': Any}}
             self.type_checking = False
+        if self.payload_type is None:
+            self.payload_type = Any
 
     def connect(self, input_ports: Union[InputPort, tuple[InputPort], list[InputPort]]):
         """Connects self and the other InputPort(s)"""
@@ -204,8 +209,8 @@ class OutputPort(Port):
                     result = issubclass(output_type, input_type)
                     return result
                 except TypeError as e:
-                    print(f"TypeError in subclass check. output_type: {output_type}, input_type: {input_type}",
-                          f"\n\n{e}")
+                    logger.debug("TypeError in subclass check. output_type: {}, "
+                                 "input_type: {}\n\n{}", output_type, input_type, e)
                     return False
             
             # Actually call _is_compatible with the payload types
@@ -311,8 +316,12 @@ class OutputPort(Port):
                 for name, item in self.required_items.items()
                 }
             return self.pack_payload_callback(**staged_dict)
+        elif len(self.required_items) == 1:
+            # Passthrough: the single staged item is the payload
+            return next(iter(self.required_items.values()))['value']
         else:
-            raise ValueError(f"pack_payload_callback must be set for port '{self.name}'")
+            raise ValueError(f"pack_payload_callback must be set for port '{self.name}' "
+                             "when it has more than one required item")
 
     def __gt__(self, other):
         """Implements self.connect(other) through el1.some_output > el2.some_input"""
@@ -341,7 +350,7 @@ class Ports(param.Parameterized):
         super().__init__(**params)
         self.containing_element = containing_element
 
-    def add_input(self, name: str, unpack_payload_callback, **kwargs):
+    def add_input(self, name: str, unpack_payload_callback=None, **kwargs):
         input_port = InputPort(
             name=name,
             unpack_payload_callback=unpack_payload_callback,
@@ -350,7 +359,21 @@ class Ports(param.Parameterized):
         self.input[name] = input_port
         return input_port
     
-    def add_output(self, name: str, pack_payload_callback, **kwargs):
+    def add_output(
+            self,
+            name: str,
+            pack_payload_callback=None,
+            pass_through: bool | str = False,
+            **kwargs):
+        """
+        Creates and stores an OutputPort. With pass_through, the port has a
+        single required item of the port's payload_type, which is emitted as
+        the payload. pass_through names that item, or names it 'payload' when True.
+        """
+        if pass_through:
+            item_name = 'payload' if pass_through is True else pass_through
+            kwargs['required_items'] = {
+                item_name: {'value': None, 'type': kwargs['payload_type']}}
         output_port = OutputPort(
             name=name,
             pack_payload_callback=pack_payload_callback,
@@ -0,0 +1,33 @@
+from bokeh.document import Document
+import panel as pn
+import param
+
+from pyllments.base.component_base import Component
+
+
+class Counter(param.Parameterized):
+    count = param.Integer(default=0)
+
+
+def test_watch_for_view_unwatched_on_session_destroyed():
+    counter = Counter()
+    doc = Document()
+    pn.state.curdoc = doc
+    try:
+        watcher = Component.watch_for_view(counter, lambda event: None, 'count')
+        assert counter.param.watchers['count']['value'] == [watcher]
+
+        for callback in doc.session_destroyed_callbacks:
+            callback(None)
+    finally:
+        pn.state.curdoc = None
+
+    # param keeps the emptied per-parameter lists
+    assert counter.param.watchers['count']['value'] == []
+
+
+def test_watch_for_view_outside_session():
+    counter = Counter()
+    watcher = Component.watch_for_view(counter, lambda event: None, 'count')
+
+    assert counter.param.watchers['count']['value'] == [watcher]
@@ -1,5 +1,6 @@
 from pyllments.elements.chat_interface.chat_interface_element import ChatInterfaceElement
 from pyllments.payloads.message import MessagePayload
+from pyllments.tests.elements.test_element import TestElement
 
 
 def stream_chat_interface_test():
@@ -17,4 +18,17 @@ def stream_chat_interface_test():
     
     chat_interface_element.model.new_message = new_payload
     
-    assert chat_interface_element.model.message_list[0] is new_payload
\ No newline at end of file
+    assert chat_interface_element.model.message_list[0] is new_payload
+
+def test_chat_interface_emits_message():
+    chat_interface_element = ChatInterfaceElement()
+    sender, receiver = TestElement(), TestElement()
+    receiver.ports.input['test_input'].payload_type = MessagePayload
+    sender.ports.output['test_output'] > chat_interface_element.ports.input['message_emit_input']
+    chat_interface_element.ports.output['message_output'] > receiver.ports.input['test_input']
+
+    message = MessagePayload(content='hello')
+    sender.send_payload(message)
+
+    assert receiver.received_payloads == [message]
+    assert chat_interface_element.model.new_message is message
@@ -0,0 +1,24 @@
+import pytest
+
+pytest.importorskip('langchain_text_splitters')
+
+from pyllments.elements.chunker.text_chunker_element import TextChunkerElement
+from pyllments.payloads.chunk import ChunkPayload
+from pyllments.payloads.file import FilePayload
+from pyllments.tests.elements.test_element import TestElement
+
+
+def test_text_chunker_emits_chunks():
+    text_chunker_element = TextChunkerElement(chunk_size=20, chunk_overlap=0)
+    sender, receiver = TestElement(), TestElement()
+    receiver.ports.input['test_input'].payload_type = list[ChunkPayload]
+    sender.ports.output['test_output'] > text_chunker_element.ports.input['file_input']
+    text_chunker_element.ports.output['chunk_output'] > receiver.ports.input['test_input']
+
+    sender.send_payload(FilePayload(
+        filename='notes.txt', b_file=b'first sentence here. second sentence here.',
+        local_path='notes.txt'))
+
+    [chunks] = receiver.received_payloads
+    assert chunks and all(isinstance(chunk, ChunkPayload) for chunk in chunks)
+    assert all(chunk.model.source_filepath == 'notes.txt' for chunk in chunks)
@@ -0,0 +1,44 @@
+import param
+
+from pyllments.elements.embedder.embedder_element import EmbedderElement
+from pyllments.payloads.chunk import ChunkPayload
+from pyllments.payloads.message import MessagePayload
+from pyllments.tests.elements.test_element import TestElement
+
+
+class LengthEncoder(param.Parameterized):
+    """Encodes each sentence by its length, in place of a SentenceTransformer"""
+    model_name = param.String()
+    embedding_dims = param.Integer(default=2)
+
+    def encode(self, sentences: list[str]) -> list[list[float]]:
+        return [[float(len(sentence))] * self.embedding_dims for sentence in sentences]
+
+
+def setup_embedder(input_name: str, output_name: str, payload_type):
+    embedder_element = EmbedderElement(encoder_model_class=LengthEncoder)
+    sender, receiver = TestElement(), TestElement()
+    receiver.ports.input['test_input'].payload_type = payload_type
+    sender.ports.output['test_output'] > embedder_element.ports.input[input_name]
+    embedder_element.ports.output[output_name] > receiver.ports.input['test_input']
+    return sender, receiver
+
+
+def test_embedder_emits_processed_chunks():
+    sender, receiver = setup_embedder(
+        'chunk_input', 'processed_chunks_output', list[ChunkPayload])
+    chunk = ChunkPayload(text='abc')
+    sender.send_payload([chunk])
+
+    assert receiver.received_payloads == [[chunk]]
+    assert chunk.model.embedding == [3.0, 3.0]
+
+
+def test_embedder_emits_processed_message():
+    sender, receiver = setup_embedder(
+        'message_input', 'processed_message_output', MessagePayload)
+    message = MessagePayload(content='abcd')
+    sender.send_payload(message)
+
+    assert receiver.received_payloads == [message]
+    assert message.model.embedding == [4.0, 4.0]
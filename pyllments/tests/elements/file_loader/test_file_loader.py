@@ -0,0 +1,16 @@
+from pyllments.elements.file_loader.file_loader_element import FileLoaderElement
+from pyllments.payloads.file import FilePayload
+from pyllments.tests.elements.test_element import TestElement
+
+
+def test_file_loader_emits_file_list():
+    file_loader_element = FileLoaderElement()
+    receiver = TestElement()
+    receiver.ports.input['test_input'].payload_type = list[FilePayload]
+    file_loader_element.ports.output['file_list_output'] > receiver.ports.input['test_input']
+
+    file_payload = file_loader_element.model.stage_file('notes.txt', b'notes', 'text/plain')
+    file_loader_element.emit_files()
+
+    assert receiver.received_payloads == [[file_payload]]
+    assert file_loader_element.model.file_list == []
@@ -0,0 +1,86 @@
+import asyncio
+
+from pyllments.elements.flow_control.flow_controller import FlowController
+from pyllments.payloads.message import MessagePayload
+from pyllments.tests.elements.test_element import TestElement
+
+
+def setup_flow_controller(flow_fn):
+    flow_controller = FlowController(
+        flow_fn=flow_fn,
+        flow_map={
+            'input': {'message_input': MessagePayload},
+            'output': {'message_output': MessagePayload}})
+    sender, receiver = TestElement(), TestElement()
+    receiver.ports.input['test_input'].payload_type = MessagePayload
+    flow_controller.connect_input('message_input', sender.ports.output['test_output'])
+    flow_controller.connect_output('message_output', receiver.ports.input['test_input'])
+    return flow_controller, sender, receiver
+
+
+def test_async_flow_fn_emits():
+    async def flow_fn(active_input_port, c, message_input, message_output):
+        await asyncio.sleep(0)
+        message_output.emit(active_input_port.payload)
+
+    flow_controller, sender, receiver = setup_flow_controller(flow_fn)
+    message = MessagePayload(content='hello')
+
+    async def send():
+        sender.send_payload(message)
+        assert receiver.received_payloads == []
+        await asyncio.sleep(0.01)
+
+    asyncio.run(send())
+    assert receiver.received_payloads == [message]
+    assert flow_controller.flow_port_map['message_input'].payload is None
+
+
+def test_future_flow_result_is_awaited():
+    """The payload stays on the flow port until a returned future completes"""
+    futures = []
+
+    def flow_fn(active_input_port, c, message_input, message_output):
+        futures.append(asyncio.get_running_loop().create_future())
+        return futures[-1]
+
+    flow_controller, sender, receiver = setup_flow_controller(flow_fn)
+    message = MessagePayload(content='hello')
+
+    async def send():
+        sender.send_payload(message)
+        assert flow_controller.flow_port_map['message_input'].payload is message
+        futures[0].set_result(None)
+        await asyncio.sleep(0)
+
+    asyncio.run(send())
+    assert flow_controller.flow_port_map['message_input'].payload is None
+
+
+def test_reassigned_flow_fn_dispatch():
+    """The cached async check follows flow_fn when it is swapped either way"""
+    def sync_flow_fn(active_input_port, c, message_input, message_output):
+        message_output.emit(active_input_port.payload)
+
+    async def async_flow_fn(active_input_port, c, message_input, message_output):
+        await asyncio.sleep(0)
+        message_output.emit(active_input_port.payload)
+
+    flow_controller, sender, receiver = setup_flow_controller(sync_flow_fn)
+    messages = [MessagePayload(content=str(i)) for i in range(3)]
+
+    async def send():
+        flow_controller.flow_fn = async_flow_fn
+        sender.send_payload(messages[0])
+        assert receiver.received_payloads == []
+        await asyncio.sleep(0.01)
+        assert receiver.received_payloads == messages[:1]
+
+        flow_controller.flow_fn = sync_flow_fn
+        sender.send_payload(messages[1])
+        assert receiver.received_payloads == messages[:2]
+
+    asyncio.run(send())
+    # Without a running loop the sync flow_fn needs no scheduling
+    sender.send_payload(messages[2])
+    assert receiver.received_payloads == messages
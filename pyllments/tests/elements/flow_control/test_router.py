@@ -0,0 +1,53 @@
+import pytest
+
+from pyllments.elements.flow_control.flow_controllers.router import Router
+from pyllments.payloads.message import MessagePayload
+from pyllments.tests.elements.test_element import TestElement
+
+
+def setup_router():
+    sender = TestElement()
+    receivers = {'a': TestElement(), 'b': TestElement()}
+    for receiver in receivers.values():
+        receiver.ports.input['test_input'].payload_type = MessagePayload
+    router = Router(
+        key_port_map={
+            key: receiver.ports.input['test_input']
+            for key, receiver in receivers.items()},
+        payload_key_fn=lambda payload: payload.model.content,
+        incoming_output_port=sender.ports.output['test_output'])
+    return router, sender, receivers
+
+
+def test_router_dispatches_by_key():
+    router, sender, receivers = setup_router()
+    payload_a = MessagePayload(content='a')
+    payload_b = MessagePayload(content='b')
+    sender.send_payload(payload_a)
+    sender.send_payload(payload_b)
+
+    assert receivers['a'].received_payloads == [payload_a]
+    assert receivers['b'].received_payloads == [payload_b]
+
+
+def test_router_rebinds_payload_key_fn():
+    router, sender, receivers = setup_router()
+    router.payload_key_fn = lambda payload: 'b'
+    payload = MessagePayload(content='a')
+    sender.send_payload(payload)
+
+    assert receivers['a'].received_payloads == []
+    assert receivers['b'].received_payloads == [payload]
+
+
+def test_router_rejects_mixed_payload_types():
+    message_receiver, other_receiver = TestElement(), TestElement()
+    message_receiver.ports.input['test_input'].payload_type = MessagePayload
+    other_receiver.ports.input['test_input'].payload_type = str
+
+    with pytest.raises(ValueError, match="All input ports"):
+        Router(
+            key_port_map={
+                'message': message_receiver.ports.input['test_input'],
+                'other': other_receiver.ports.input['test_input']},
+            payload_key_fn=lambda payload: 'message')
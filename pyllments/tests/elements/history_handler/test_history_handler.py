@@ -0,0 +1,16 @@
+from pyllments.elements.history_handler.history_handler_element import HistoryHandlerElement
+from pyllments.payloads.message import MessagePayload
+from pyllments.tests.elements.test_element import TestElement
+
+
+def test_history_handler_emits_context():
+    history_handler_element = HistoryHandlerElement()
+    sender, receiver = TestElement(), TestElement()
+    receiver.ports.input['test_input'].payload_type = list[MessagePayload]
+    sender.ports.output['test_output'] > history_handler_element.ports.input['message_input']
+    history_handler_element.ports.output['messages_output'] > receiver.ports.input['test_input']
+
+    message = MessagePayload(content='hello')
+    sender.send_payload(message)
+
+    assert receiver.received_payloads == [[message]]
@@ -0,0 +1,22 @@
+import pytest
+
+pytest.importorskip('litellm')
+
+from pyllments.elements.llm_chat.llm_chat_element import LLMChatElement
+from pyllments.payloads.message import MessagePayload
+from pyllments.tests.elements.test_element import TestElement
+
+
+def test_llm_chat_emits_response():
+    llm_chat_element = LLMChatElement()
+    response = MessagePayload(role='assistant', content='hi')
+    # Answers without calling a provider
+    llm_chat_element.model.generate_response = lambda messages: response
+    sender, receiver = TestElement(), TestElement()
+    receiver.ports.input['test_input'].payload_type = MessagePayload
+    sender.ports.output['test_output'] > llm_chat_element.ports.input['messages_input']
+    llm_chat_element.ports.output['message_output'] > receiver.ports.input['test_input']
+
+    sender.send_payload([MessagePayload(content='hello')])
+
+    assert receiver.received_payloads == [response]
@@ -15,4 +15,25 @@ def test_port_connection():
     el1.ports.output.some_output > el2.ports.input.some_input
 
     assert el1.ports.output.some_output.connected_elements[0] is el2
-    assert el2.ports.input.some_input.connected_elements[0] is el1
\ No newline at end of file
+    assert el2.ports.input.some_input.connected_elements[0] is el1
+
+def test_passthrough_output_port():
+    """
+    An output port without a pack_payload_callback emits its single
+    staged item as the payload
+    """
+    el1 = Element()
+    el2 = Element()
+    received = []
+
+    def unpack(payload: Payload):
+        received.append(payload)
+
+    el1.ports.add_output(name='some_output', payload_type=Payload)
+    el2.ports.add_input(name='some_input', unpack_payload_callback=unpack)
+    el1.ports.output['some_output'] > el2.ports.input['some_input']
+
+    payload = Payload()
+    el1.ports.output['some_output'].stage_emit(payload=payload)
+
+    assert received == [payload]
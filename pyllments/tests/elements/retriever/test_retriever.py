@@ -0,0 +1,45 @@
+import asyncio
+
+import pytest
+
+from pyllments.elements.retriever.retriever_element import RetrieverElement
+from pyllments.payloads.chunk import ChunkPayload
+from pyllments.payloads.message import MessagePayload
+from pyllments.tests.elements.test_element import TestElement
+
+
+def test_retriever_element_view_update_delay(tmp_path):
+    """Element-only params are set on the element and not passed to the model"""
+    retriever_element = RetrieverElement(
+        url=str(tmp_path), collection_name='test', view_update_delay=0.1)
+
+    assert retriever_element.view_update_delay == 0.1
+    assert retriever_element.model.collection_name == 'test'
+
+
+def test_retriever_element_query_without_embedding(tmp_path):
+    """A query without an embedding raises to the sender, even within an event loop"""
+    retriever_element = RetrieverElement(url=str(tmp_path), collection_name='test')
+    test_element = TestElement()
+    test_element.ports.output['test_output'] > retriever_element.ports.input['message_input']
+
+    async def send_query():
+        with pytest.raises(ValueError, match="No embedding"):
+            test_element.send_payload(MessagePayload(content='query'))
+        assert not retriever_element._retrieval_tasks
+
+    asyncio.run(send_query())
+
+
+def test_retriever_element_close_flushes_buffered_chunks(tmp_path):
+    retriever_element = RetrieverElement(
+        url=str(tmp_path), collection_name='test', flush_interval=60)
+    test_element = TestElement()
+    test_element.ports.output['test_output'] > retriever_element.ports.input['chunk_input']
+
+    async def send_chunk_and_close():
+        test_element.send_payload(ChunkPayload(text='chunk', embedding=[0.0] * 768))
+        await retriever_element.aclose()
+
+    asyncio.run(send_chunk_and_close())
+    assert retriever_element.model.collection.collection.count_rows() == 1
@@ -0,0 +1,119 @@
+import asyncio
+
+from pyllments.elements.retriever.retriever_model import RetrieverModel
+from pyllments.payloads.chunk import ChunkPayload
+from pyllments.payloads.message import MessagePayload
+
+
+def make_chunk(i: int) -> ChunkPayload:
+    embedding = [0.0] * 768
+    embedding[i] = 1.0
+    return ChunkPayload(
+        text=f'chunk {i}', embedding=embedding, source_filepath='test.txt',
+        start_idx=i, end_idx=i + 1)
+
+
+def count_rows(retriever_model: RetrieverModel) -> int:
+    return retriever_model.collection.collection.count_rows()
+
+
+def test_add_item_without_loop_writes_immediately(tmp_path):
+    retriever_model = RetrieverModel(url=str(tmp_path), collection_name='test')
+    retriever_model.add_item(make_chunk(0))
+
+    assert count_rows(retriever_model) == 1
+    assert not retriever_model._pending_chunks
+
+
+def test_add_item_flushes_at_threshold(tmp_path):
+    retriever_model = RetrieverModel(
+        url=str(tmp_path), collection_name='test', batch_threshold=3, flush_interval=60)
+
+    async def add_chunks():
+        loop = asyncio.get_running_loop()
+        for i in range(2):
+            retriever_model.add_item(make_chunk(i))
+        assert len(retriever_model._pending_chunks) == 2
+        retriever_model.add_item(make_chunk(2))
+        assert not retriever_model._pending_chunks
+        assert retriever_model._flush_handle is None
+        # Queued behind the write on the model's single I/O thread
+        return await loop.run_in_executor(
+            retriever_model._executor, count_rows, retriever_model)
+
+    assert asyncio.run(add_chunks()) == 3
+
+
+def test_add_item_flushes_after_interval(tmp_path):
+    retriever_model = RetrieverModel(
+        url=str(tmp_path), collection_name='test', flush_interval=0.05)
+
+    async def add_chunk():
+        loop = asyncio.get_running_loop()
+        retriever_model.add_item(make_chunk(0))
+        assert len(retriever_model._pending_chunks) == 1
+        await asyncio.sleep(0.1)
+        assert not retriever_model._pending_chunks
+        return await loop.run_in_executor(
+            retriever_model._executor, count_rows, retriever_model)
+
+    assert asyncio.run(add_chunk()) == 1
+
+
+def test_aretrieve_includes_buffered_chunks(tmp_path):
+    retriever_model = RetrieverModel(
+        url=str(tmp_path), collection_name='test', flush_interval=60)
+    query = MessagePayload(content='query', embedding=make_chunk(1).model.embedding)
+
+    async def retrieve():
+        for i in range(3):
+            retriever_model.add_item(make_chunk(i))
+        return await retriever_model.aretrieve(query)
+
+    chunks = asyncio.run(retrieve())
+    assert len(chunks) == 3
+    assert chunks[0].model.text == 'chunk 1'
+
+
+def test_retrieve_after_add_items_in_loop(tmp_path):
+    """A sync query waits for the writes queued before it"""
+    retriever_model = RetrieverModel(url=str(tmp_path), collection_name='test')
+    query = MessagePayload(content='query', embedding=make_chunk(0).model.embedding)
+
+    async def add_and_retrieve():
+        retriever_model.add_items([make_chunk(i) for i in range(3)])
+        return retriever_model.retrieve(query)
+
+    chunks = asyncio.run(add_and_retrieve())
+    retriever_model.close()
+    assert len(chunks) == 3
+    assert chunks[0].model.text == 'chunk 0'
+
+
+def test_close_flushes_buffered_chunks(tmp_path):
+    """Chunks still waiting for the timed flush are written on close"""
+    retriever_model = RetrieverModel(
+        url=str(tmp_path), collection_name='test', flush_interval=60)
+
+    async def add_chunk():
+        retriever_model.add_item(make_chunk(0))
+
+    asyncio.run(add_chunk())
+    assert len(retriever_model._pending_chunks) == 1
+    retriever_model.close()
+
+    assert not retriever_model._pending_chunks
+    assert count_rows(retriever_model) == 1
+
+
+def test_aclose_flushes_buffered_chunks(tmp_path):
+    retriever_model = RetrieverModel(
+        url=str(tmp_path), collection_name='test', flush_interval=60)
+
+    async def add_chunk_and_close():
+        retriever_model.add_item(make_chunk(0))
+        await retriever_model.aclose()
+        assert retriever_model._flush_handle is None
+
+    asyncio.run(add_chunk_and_close())
+    assert count_rows(retriever_model) == 1
@@ -1,4 +1,5 @@
-from typing import Any
+from collections import deque
+from typing import Any, Callable
 
 import param
 
@@ -11,37 +12,88 @@ class TestElement(Element):
     When set up as an input element, it will store the received payloads in a list.
     When set up as an output element, it will emit the the specified payload with send_payload
     """
+    # Not a pytest test class, despite its name
+    __test__ = False
+
     receive_callback = param.Callable(default=None, doc="""
         Callback function for inspecting received payloads. 
         Used with logger.info(), so it should return a printable object.""")
+    store_received_payloads = param.Boolean(default=True, doc="""
+        Whether to keep the received payloads for later inspection""")
+    received_payloads_maxlen = param.Integer(default=None, allow_None=True, bounds=(1, None), doc="""
+        The max amount of received payloads to keep. The oldest payloads are
+        dropped once the limit is reached. None keeps every payload.""")
 
     def __init__(self, **params):
         super().__init__(**params)
+        self._received_payloads = deque(maxlen=self.received_payloads_maxlen)
         self._setup_ports()
 
-    def _setup_ports(self):
-        def unpack(payload: Any):
+    @property
+    def received_payloads(self) -> list:
+        """The stored received payloads, oldest first"""
+        return list(self._received_payloads)
+
+    def _create_unpack(self) -> Callable[[Any], None]:
+        """
+        Returns an unpack callback specialized for the current settings, so
+        no per-payload checks are made for disabled storage or callbacks
+        """
+        received_payloads = self._received_payloads
+        receive_callback = self.receive_callback
+
+        def unpack_store(payload: Any):
             """Store the received payload"""
-            if self.receive_callback:
-                logger.info(f"Unpacking in TestElement: {self.receive_callback(payload)}")
-    
+            received_payloads.append(payload)
+
+        def unpack_callback(payload: Any):
+            """Log the received payload"""
+            # Lazy so the callback only runs when an INFO sink is active
+            logger.opt(lazy=True).info(
+                "Unpacking in TestElement: {}", lambda: receive_callback(payload))
+
+        def unpack_store_callback(payload: Any):
+            """Store and log the received payload"""
+            received_payloads.append(payload)
+            logger.opt(lazy=True).info(
+                "Unpacking in TestElement: {}", lambda: receive_callback(payload))
+
+        def unpack_ignore(payload: Any):
+            """Discard the received payload"""
+
+        match (self.store_received_payloads, bool(receive_callback)):
+            case (True, True):
+                return unpack_store_callback
+            case (True, False):
+                return unpack_store
+            case (False, True):
+                return unpack_callback
+            case _:
+                return unpack_ignore
+
+    def _setup_ports(self):
         self.ports.add_input(
             name='test_input',
-            unpack_payload_callback=unpack
+            unpack_payload_callback=self._create_unpack()
         )
 
-        def pack(payload: Any) -> Any:
-            """Return the stored output payload"""
-            return payload
-        # Setup output port
-        self.ports.add_output(
+        def _rebind_unpack(event):
+            self.ports.input['test_input'].unpack_payload_callback = self._create_unpack()
+
+        self.param.watch(
+            _rebind_unpack,
+            ['store_received_payloads', 'receive_callback'])
+
+        # Setup output port - the staged payload passes straight through
+        test_output = self.ports.add_output(
             name='test_output',
-            pack_payload_callback=pack
+            payload_type=Any
         )
+        self._stage_emit_output = test_output.stage_emit
 
     def clear_received_payloads(self):
         """Clear the list of received payloads"""
-        self.received_payloads = []
+        self._received_payloads.clear()
 
     def send_payload(self, payload: Any):
-        self.ports.output['test_output'].stage_emit(payload=payload)
+        self._stage_emit_output(payload=payload)
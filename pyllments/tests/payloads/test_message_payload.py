@@ -0,0 +1,63 @@
+import panel as pn
+import pytest
+
+from pyllments.payloads.message import MessagePayload
+from pyllments.payloads.message.message_payload import is_plain_text
+
+
+@pytest.mark.parametrize('content', [
+    'hello there', 'a -- b', 'x = y', 'Done, next'])
+def test_is_plain_text(content):
+    assert is_plain_text(content)
+
+
+@pytest.mark.parametrize('content', [
+    '- buy milk', '1. first', '2) second', '    code', 'a ~~b~~ c', '&copy;',
+    '**bold**', 'see example.com', 'http://localhost:8000', '---', '___',
+    'Title\n===', '===', ' \tcode', '\t code', '//host', '+.tld', '1.5 apples'])
+def test_is_not_plain_text(content):
+    assert not is_plain_text(content)
+
+
+def test_static_view_switches_to_markdown():
+    payload = MessagePayload(content='plain content', role='user', mode='atomic')
+    view = payload.create_static_view()
+    assert isinstance(view[0], pn.pane.HTML)
+    payload.model.content = 'new **bold** content'
+    assert isinstance(view[0], pn.pane.Markdown)
+    assert view[0].object == 'new **bold** content'
+    # The replacement pane keeps receiving updates
+    payload.model.content = 'more content'
+    assert view[0].object == 'more content'
+
+
+@pytest.mark.parametrize('create_view', ['create_static_view', 'create_collapsible_view'])
+def test_view_reused_for_same_arguments(create_view):
+    payload = MessagePayload(content='content', role='user')
+    view = getattr(payload, create_view)(show_role=True)
+
+    assert getattr(payload, create_view)(show_role=True) is view
+
+
+def test_static_view_with_other_arguments():
+    payload = MessagePayload(content='content', role='user')
+    view = payload.create_static_view()
+    narrow_view = payload.create_static_view(width=100, show_role=False)
+
+    assert narrow_view is not view
+    assert narrow_view.width == 100 and len(narrow_view) == 1
+    # The view already created keeps its layout
+    assert view.width is None and len(view) == 2
+    payload.model.content = 'new content'
+    assert view[0].object == narrow_view[0].object == '<p>new content</p>'
+
+
+def test_collapsible_view_with_other_arguments():
+    payload = MessagePayload(content='a' * 20, role='user')
+    view = payload.create_collapsible_view(truncation_length=10)
+    other_view = payload.create_collapsible_view(truncation_length=15, show_role=False)
+
+    assert other_view is not view
+    assert view[1].object == f"<p>{'a' * 10}...</p>"
+    assert other_view[1].object == f"<p>{'a' * 15}...</p>"
+    assert len(view) == 3 and len(other_view) == 2